@@ -4,11 +4,11 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from db import database,SessionLocal,engine,Base  # ← import the `Database` instance
 from contextlib import asynccontextmanager
-import models, schemas
+import models, schemas, recurrence
 from typing import List, Optional
-from sqlalchemy import func
+from sqlalchemy import func, or_
 import re
-from datetime import date
+from datetime import date, datetime, timedelta
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.requests import Request
 import time
@@ -104,9 +104,52 @@ def create_category(cat: schemas.CategoryCreate, db: Session = Depends(get_db),
     db.refresh(db_cat)
     return db_cat
 
-@app.get("/v1/categories/",tags=["Categories"],summary="List all spending categories",response_model=List[schemas.CategoryRead])
-def read_categories(skip: int =0,limit:int=100,db:Session=Depends(get_db),user_id: str = Depends(get_current_user_id)):
-    return db.query(models.Category).filter(models.Category.user_id==user_id).offset(skip).limit(limit).all()
+#longest start..end range read_categories will compute stats for
+MAX_STATS_DAYS = 366
+
+@app.get("/v1/categories/",tags=["Categories"],summary="List all spending categories",response_model=List[schemas.CategoryWithStats],response_model_exclude_none=True)
+def read_categories(skip: int =0,limit:int=100,stats: bool = False,month: Optional[str] = None,start: Optional[date] = None,end: Optional[date] = None,db:Session=Depends(get_db),user_id: str = Depends(get_current_user_id)):
+    query = db.query(models.Category).filter(models.Category.user_id==user_id)
+    if not stats:
+        return query.offset(skip).limit(limit).all()
+
+    #stats cover a month (default: current) or an inclusive start..end range
+    if start or end:
+        if not (start and end) or end < start:
+            raise HTTPException(status_code=400, detail="Both start and end are required and end must not be before start")
+        if (end - start).days >= MAX_STATS_DAYS or end == date.max:
+            raise HTTPException(status_code=400, detail=f"Stats range cannot be longer than {MAX_STATS_DAYS} days")
+        range_start, range_end = start, end + timedelta(days=1)
+    else:
+        range_start, range_end = month_bounds(month or date.today().strftime("%Y-%m"))
+
+    #spend per category in one grouped query, joined onto the page of categories
+    totals = (db.query(
+        models.Expense.category_id,
+        func.sum(models.Expense.amount).label("spent"),
+        func.count(models.Expense.id).label("count")
+    ).filter(models.Expense.user_id == user_id, models.Expense.date >= range_start, models.Expense.date < range_end).group_by(models.Expense.category_id).subquery())
+
+    rows = (query.add_columns(
+        func.coalesce(totals.c.spent, 0).label("spent"),
+        func.coalesce(totals.c.count, 0).label("count")
+    ).outerjoin(totals, totals.c.category_id == models.Category.id).offset(skip).limit(limit).all())
+
+    categories = {}
+    for category, spent, count in rows:
+        categories[category.id] = {
+            "id": category.id,
+            "name": category.name,
+            "limit_amount": category.limit_amount,
+            "spent": spent,
+            "count": count,
+        }
+    for category_id, (spent, count) in recurring_totals(db, user_id, range_start, range_end, list(categories)).items():
+        categories[category_id]["spent"] += spent
+        categories[category_id]["count"] += count
+    for category in categories.values():
+        category["remaining"] = category["limit_amount"] - category["spent"]
+    return list(categories.values())
 
 @app.get("/v1/categories/{category_id}",tags=["Categories"],summary="List specific category",response_model=schemas.CategoryRead)
 def read_category(category_id:int,db:Session=Depends(get_db),user_id: str = Depends(get_current_user_id)):
@@ -166,16 +209,97 @@ def read_expense(expense_id: int, db:Session = Depends(get_db),user_id: str = De
         raise HTTPException(status_code=404, detail="Expense not found")
     return exp
 
-@app.get("/v1/expenses/",response_model=List[schemas.ExpenseRead],tags=["Expenses"],summary="List expenses, optionally filtered by month")
+#how far back read_expenses expands recurring rules when no month is given
+RECURRING_LOOKBACK_DAYS = 366
+
+def month_bounds(month: str):
+    #half open [start, end) date range covering a YYYY-MM month
+    try:
+        start = datetime.strptime(month, "%Y-%m").date()
+        end = date(start.year + (start.month == 12), start.month % 12 + 1, 1)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Month must be a valid YYYY-MM month")
+    return start, end
+
+def expand_recurring(db: Session, user_id: str, start: date, end: date):
+    #expand the user's recurring rules into occurrences in [start, end), applying skips and overrides
+    rules = db.query(models.RecurringExpense).filter(
+        models.RecurringExpense.user_id == user_id,
+        models.RecurringExpense.start_date < end,
+        or_(models.RecurringExpense.end_date.is_(None), models.RecurringExpense.end_date >= start),
+    ).all()
+    if not rules:
+        return []
+    #one query for every override in range instead of one per rule
+    overrides = {
+        (o.recurring_id, o.date): o
+        for o in db.query(models.RecurringOverride).join(models.RecurringExpense).filter(
+            models.RecurringExpense.user_id == user_id,
+            models.RecurringOverride.date >= start,
+            models.RecurringOverride.date < end,
+        )
+    }
+    occurrences = []
+    for rule in rules:
+        for day in recurrence.occurrences(rule, start, end):
+            override = overrides.get((rule.id, day))
+            if override and override.skipped:
+                continue
+            occurrences.append({
+                "recurring_id": rule.id,
+                "category_id": rule.category_id,
+                "amount": override.amount if override and override.amount is not None else rule.amount,
+                "date": day,
+                "description": override.description if override and override.description is not None else rule.description,
+            })
+    return occurrences
+
+def recurring_totals(db: Session, user_id: str, start: date, end: date, category_ids: List[int]):
+    #per category (spent, count) of recurring occurrences in [start, end), counted per rule without expanding them
+    rules = db.query(models.RecurringExpense).filter(
+        models.RecurringExpense.user_id == user_id,
+        models.RecurringExpense.category_id.in_(category_ids),
+        models.RecurringExpense.start_date < end,
+        or_(models.RecurringExpense.end_date.is_(None), models.RecurringExpense.end_date >= start),
+    ).all()
+    if not rules:
+        return {}
+    totals = {}
+    rules_by_id = {}
+    for rule in rules:
+        rules_by_id[rule.id] = rule
+        count = recurrence.count_occurrences(rule, start, end)
+        spent, total = totals.get(rule.category_id, (0, 0))
+        totals[rule.category_id] = (spent + count * rule.amount, total + count)
+    #skipped occurrences come off the count, overridden amounts adjust the spend
+    overrides = db.query(models.RecurringOverride).filter(
+        models.RecurringOverride.recurring_id.in_(list(rules_by_id)),
+        models.RecurringOverride.date >= start,
+        models.RecurringOverride.date < end,
+    ).all()
+    for override in overrides:
+        rule = rules_by_id[override.recurring_id]
+        if not recurrence.is_occurrence(rule, override.date):
+            continue
+        spent, count = totals[rule.category_id]
+        if override.skipped:
+            totals[rule.category_id] = (spent - rule.amount, count - 1)
+        elif override.amount is not None:
+            totals[rule.category_id] = (spent + override.amount - rule.amount, count)
+    return totals
+
+@app.get("/v1/expenses/",response_model=List[schemas.ExpenseOccurrence],tags=["Expenses"],summary="List expenses, optionally filtered by month")
 def read_expenses(month: Optional[str] = None, db: Session = Depends(get_db),user_id: str = Depends(get_current_user_id)):
     query = db.query(models.Expense).filter_by(user_id=user_id)
     if month:
-        year, m = map(int, month.split("-"))
-        from datetime import date
-        start = date(year, m, 1)
-        end = date(year + (m == 12), m % 12 + 1, 1)
+        start, end = month_bounds(month)
         query = query.filter(models.Expense.date >= start, models.Expense.date < end)
-    return query.all()
+    else:
+        #without a month, recurring rules are only expanded over the last year up to today
+        end = date.today() + timedelta(days=1)
+        start = end - timedelta(days=RECURRING_LOOKBACK_DAYS)
+    expenses = query.all() + expand_recurring(db, user_id, start, end)
+    return sorted(expenses, key=lambda e: e["date"] if isinstance(e, dict) else e.date)
 
 @app.put("/v1/expenses/{expense_id}",tags=["Expenses"], summary="Update specific expense", response_model=schemas.ExpenseRead)
 def update_expense(expense_id:int, updates:schemas.ExpenseUpdate, db: Session = Depends(get_db),user_id: str = Depends(get_current_user_id)):
@@ -198,6 +322,95 @@ def delete_expense(expense_id:int,db:Session=Depends(get_db),user_id: str = Depe
     db.commit()
     return
 
+@app.post("/v1/recurring/",tags=["Recurring"], summary="Add a recurring expense rule",response_model=schemas.RecurringExpenseRead, status_code=status.HTTP_201_CREATED)
+def create_recurring(rule: schemas.RecurringExpenseCreate, db: Session = Depends(get_db),user_id: str = Depends(get_current_user_id)):
+    category = db.query(models.Category).filter_by(id=rule.category_id, user_id=user_id).first()
+    if not category:
+        raise HTTPException(status_code=404, detail="Category not found")
+    if rule.end_date and rule.end_date < rule.start_date:
+        raise HTTPException(status_code=400, detail="end_date must not be before start_date")
+    db_rule = models.RecurringExpense(**rule.model_dump(), user_id=user_id)
+    db.add(db_rule)
+    db.commit()
+    db.refresh(db_rule)
+    return db_rule
+
+@app.get("/v1/recurring/",tags=["Recurring"], summary="List recurring expense rules",response_model=List[schemas.RecurringExpenseRead])
+def read_recurring_rules(db: Session = Depends(get_db),user_id: str = Depends(get_current_user_id)):
+    return db.query(models.RecurringExpense).filter_by(user_id=user_id).all()
+
+@app.get("/v1/recurring/{recurring_id}",tags=["Recurring"], summary="Get a specific recurring expense rule",response_model=schemas.RecurringExpenseRead)
+def read_recurring(recurring_id: int, db: Session = Depends(get_db),user_id: str = Depends(get_current_user_id)):
+    rule = db.query(models.RecurringExpense).filter_by(id=recurring_id, user_id=user_id).first()
+    if not rule:
+        raise HTTPException(status_code=404, detail="Recurring expense not found")
+    return rule
+
+@app.put("/v1/recurring/{recurring_id}",tags=["Recurring"], summary="Update a recurring expense rule",response_model=schemas.RecurringExpenseRead)
+def update_recurring(recurring_id: int, updates: schemas.RecurringExpenseUpdate, db: Session = Depends(get_db),user_id: str = Depends(get_current_user_id)):
+    rule = db.query(models.RecurringExpense).filter_by(id=recurring_id, user_id=user_id).first()
+    if not rule:
+        raise HTTPException(status_code=404, detail="Recurring expense not found")
+    changes = updates.model_dump(exclude_unset=True)
+    nulls = [k for k in ("category_id", "amount", "freq", "interval", "start_date") if k in changes and changes[k] is None]
+    if nulls:
+        raise HTTPException(status_code=400, detail=f"{', '.join(nulls)} cannot be null")
+    if "category_id" in changes and not db.query(models.Category).filter_by(id=changes["category_id"], user_id=user_id).first():
+        raise HTTPException(status_code=404, detail="Category not found")
+    end_date = changes.get("end_date", rule.end_date)
+    if end_date and end_date < changes.get("start_date", rule.start_date):
+        raise HTTPException(status_code=400, detail="end_date must not be before start_date")
+    for k,v in changes.items():
+        setattr(rule,k,v)
+    #a new schedule can move occurrences, drop overrides that no longer land on one
+    if changes.keys() & {"freq", "interval", "start_date", "end_date"}:
+        for override in list(rule.overrides):
+            if not recurrence.is_occurrence(rule, override.date):
+                db.delete(override)
+    db.commit()
+    db.refresh(rule)
+    return rule
+
+@app.delete("/v1/recurring/{recurring_id}",tags=["Recurring"], summary="Delete a recurring expense rule",status_code=status.HTTP_204_NO_CONTENT)
+def delete_recurring(recurring_id: int, db: Session = Depends(get_db),user_id: str = Depends(get_current_user_id)):
+    rule = db.query(models.RecurringExpense).filter_by(id=recurring_id, user_id=user_id).first()
+    if not rule:
+        raise HTTPException(status_code=404, detail="Recurring expense not found")
+    db.delete(rule)
+    db.commit()
+    return
+
+@app.put("/v1/recurring/{recurring_id}/occurrences/{day}",tags=["Recurring"], summary="Skip or override a single occurrence",response_model=schemas.RecurringOverrideRead)
+def set_recurring_override(recurring_id: int, day: date, data: schemas.RecurringOverrideCreate, db: Session = Depends(get_db),user_id: str = Depends(get_current_user_id)):
+    rule = db.query(models.RecurringExpense).filter_by(id=recurring_id, user_id=user_id).first()
+    if not rule:
+        raise HTTPException(status_code=404, detail="Recurring expense not found")
+    if not recurrence.is_occurrence(rule, day):
+        raise HTTPException(status_code=404, detail="No occurrence on this date")
+    override = db.query(models.RecurringOverride).filter_by(recurring_id=recurring_id, date=day).first()
+    if override:
+        for k,v in data.model_dump().items():
+            setattr(override,k,v)
+    else:
+        override = models.RecurringOverride(**data.model_dump(), recurring_id=recurring_id, date=day)
+        db.add(override)
+    db.commit()
+    db.refresh(override)
+    return override
+
+@app.delete("/v1/recurring/{recurring_id}/occurrences/{day}",tags=["Recurring"], summary="Restore a skipped or overridden occurrence",status_code=status.HTTP_204_NO_CONTENT)
+def delete_recurring_override(recurring_id: int, day: date, db: Session = Depends(get_db),user_id: str = Depends(get_current_user_id)):
+    override = db.query(models.RecurringOverride).join(models.RecurringExpense).filter(
+        models.RecurringExpense.id == recurring_id,
+        models.RecurringExpense.user_id == user_id,
+        models.RecurringOverride.date == day,
+    ).first()
+    if not override:
+        raise HTTPException(status_code=404, detail="Override not found")
+    db.delete(override)
+    db.commit()
+    return
+
 @app.post("/v1/income/", tags=["Income"], summary="Set or update monthly income",response_model=schemas.IncomeRead, status_code=status.HTTP_201_CREATED)
 def set_income(data: schemas.IncomeCreate, db:Session = Depends(get_db),user_id: str = Depends(get_current_user_id)):
     inc = db.query(models.Income).filter_by(user_id=user_id, month=data.month).first()
@@ -236,19 +449,31 @@ def monthly_summary(month:str,db:Session=Depends(get_db),user_id: str = Depends(
         func.coalesce(func.sum(models.Expense.amount), 0).label("spent")
     ).outerjoin(models.Expense).filter(models.Category.user_id == user_id).filter(func.strftime("%Y-%m", models.Expense.date) == month).group_by(models.Category.id).all())
 
+    #fold in recurring occurrences for the month
+    spent = {category.id: category.spent for category in results}
+    categories = {category.id: category for category in results}
+    start, end = month_bounds(month)
+    for occurrence in expand_recurring(db, user_id, start, end):
+        spent[occurrence["category_id"]] = spent.get(occurrence["category_id"], 0) + occurrence["amount"]
+    missing = set(spent) - set(categories)
+    if missing:
+        for category in db.query(models.Category).filter(models.Category.user_id == user_id, models.Category.id.in_(missing)).all():
+            categories[category.id] = category
+
     #build the summary response
     categories_summary = []
     total_spent = 0
 
-    for category in results:
-        balance = category.limit_amount - category.spent
-        total_spent+=category.spent
+    for category_id, category in categories.items():
+        category_spent = spent[category_id]
+        balance = category.limit_amount - category_spent
+        total_spent+=category_spent
         categories_summary.append({
             "category":category.name,
             "limit":category.limit_amount,
-            "spent":category.spent,
+            "spent":category_spent,
             "balance":balance,
-            "over_limit": category.spent > category.limit_amount
+            "over_limit": category_spent > category.limit_amount
             })
         
     return {
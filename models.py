@@ -1,4 +1,4 @@
-from sqlalchemy import Table, Column, Integer, String, Float, Date, ForeignKey, String
+from sqlalchemy import Table, Column, Integer, String, Float, Date, ForeignKey, String, Boolean
 from sqlalchemy.orm import relationship
 from db import Base
 from sqlalchemy import UniqueConstraint,Index
@@ -23,6 +23,12 @@ class Category(Base):
         cascade="all, delete-orphan"
     )
 
+    recurring_expenses = relationship(
+        "RecurringExpense",
+        back_populates="category",
+        cascade="all, delete-orphan"
+    )
+
 class Expense(Base):
     __tablename__ = "expenses"
 
@@ -45,3 +51,45 @@ class Income(Base):
     user_id = Column(String, index=True, nullable=False, primary_key=True)
     month = Column(String, primary_key=True)
     amount = Column(Float, nullable=False)
+
+#a recurring rule is stored once and expanded into occurrences on read instead of one expense row per month
+class RecurringExpense(Base):
+    __tablename__ = "recurring_expenses"
+
+    id = Column(Integer,primary_key=True,index=True)
+    user_id = Column(String, index=True, nullable=False)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable = False)
+    amount = Column(Float, nullable=False)
+    description = Column(String,nullable=True)
+    freq = Column(String, nullable=False)
+    interval = Column(Integer, nullable=False, default=1)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)
+
+    __table_args__ = (
+        Index("ix_recurring_user_start", "user_id", "start_date"),
+    )
+
+    category = relationship("Category",back_populates="recurring_expenses")
+    overrides = relationship(
+        "RecurringOverride",
+        back_populates="recurring",
+        cascade="all, delete-orphan"
+    )
+
+#changes a single occurrence of a rule: skip it, or replace its amount/description
+class RecurringOverride(Base):
+    __tablename__ = "recurring_overrides"
+
+    id = Column(Integer,primary_key=True,index=True)
+    recurring_id = Column(Integer, ForeignKey("recurring_expenses.id"), nullable=False)
+    date = Column(Date, nullable=False)
+    skipped = Column(Boolean, nullable=False, default=False)
+    amount = Column(Float, nullable=True)
+    description = Column(String,nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint('recurring_id', 'date', name='uq_recurring_override_date'),
+    )
+
+    recurring = relationship("RecurringExpense",back_populates="overrides")
@@ -0,0 +1,71 @@
+import calendar
+from datetime import date, timedelta
+
+FREQUENCIES = ("daily", "weekly", "monthly", "yearly")
+
+#day/month steps for one unit of each frequency
+DAY_STEPS = {"daily": 1, "weekly": 7}
+MONTH_STEPS = {"monthly": 1, "yearly": 12}
+
+
+def add_months(day: date, months: int) -> date:
+    #the 31st rolls back to the last day of shorter months (and feb 29 to feb 28)
+    total = day.month - 1 + months
+    year, month = day.year + total // 12, total % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def nth_occurrence(rule, n: int) -> date:
+    #date of the n-th (0 based) occurrence, always computed from start_date so clamped days don't drift
+    #occurrences past year 9999 are reported as date.max so range checks simply stop there
+    try:
+        if rule.freq in DAY_STEPS:
+            return rule.start_date + timedelta(days=n * rule.interval * DAY_STEPS[rule.freq])
+        return add_months(rule.start_date, n * rule.interval * MONTH_STEPS[rule.freq])
+    except (OverflowError, ValueError):
+        return date.max
+
+
+def first_index(rule, start: date) -> int:
+    #index of the first occurrence on or after start, jumping ahead instead of walking the schedule
+    if start <= rule.start_date:
+        return 0
+    if rule.freq in DAY_STEPS:
+        step = rule.interval * DAY_STEPS[rule.freq]
+        return -(-(start - rule.start_date).days // step)
+    step = rule.interval * MONTH_STEPS[rule.freq]
+    months = (start.year - rule.start_date.year) * 12 + start.month - rule.start_date.month
+    n = months // step
+    while nth_occurrence(rule, n) < start:
+        n += 1
+    return n
+
+
+def stop_date(rule, end: date) -> date:
+    #exclusive upper bound of a rule within a range ending at end, without overflowing on end_date + 1
+    if rule.end_date is None or rule.end_date >= end:
+        return end
+    return rule.end_date + timedelta(days=1)
+
+
+def occurrences(rule, start: date, end: date):
+    #yields the dates a rule fires on in [start, end), same half open range read_expenses uses for months
+    stop = stop_date(rule, end)
+    n = first_index(rule, start)
+    current = nth_occurrence(rule, n)
+    while current < stop:
+        yield current
+        n += 1
+        current = nth_occurrence(rule, n)
+
+
+def count_occurrences(rule, start: date, end: date) -> int:
+    #number of occurrences in [start, end) from index arithmetic, nothing is expanded
+    stop = stop_date(rule, end)
+    if stop <= start:
+        return 0
+    return max(first_index(rule, stop) - first_index(rule, start), 0)
+
+
+def is_occurrence(rule, day: date) -> bool:
+    return next(occurrences(rule, day, day + timedelta(days=1)), None) == day
@@ -1,7 +1,10 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Literal
 import datetime
 
+#earliest date a recurring rule may start or end on
+MIN_RECURRING_DATE = datetime.date(1900, 1, 1)
+
 class CategoryBase(BaseModel):
     name:str = Field(...,example="Fruits")
     limit_amount:float = Field(...,ge=0,example=500)
@@ -24,6 +27,12 @@ class CategoryRead(CategoryBase):
         #tells Pydantic it can read SQLAlchemy objects directly.
         from_attributes = True
 
+class CategoryWithStats(CategoryRead):
+    #only filled when read_categories is asked for stats
+    spent: Optional[float] = None
+    count: Optional[int] = None
+    remaining: Optional[float] = None
+
 class CategorySummary(BaseModel):
     category: str
     limit: float
@@ -62,6 +71,14 @@ class ExpenseRead(ExpenseBase):
     class Config:
         from_attributes = True
 
+class ExpenseOccurrence(ExpenseBase):
+    #stored expenses carry their id, occurrences expanded from a recurring rule carry recurring_id instead
+    id: Optional[int] = None
+    recurring_id: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
 class ExpenseUpdate(BaseModel):
     category_id: Optional[int] = Field(None, example=1)
     amount: Optional[float]    = Field(None, ge=0, example=250.75)
@@ -72,6 +89,52 @@ class ExpenseUpdate(BaseModel):
         from_attributes = True
 
 
+# —— Recurring Expense Schemas ——
+
+class RecurringExpenseBase(BaseModel):
+    category_id: int = Field(...,example=1)
+    amount: float = Field(...,ge=0,example=12000)
+    description: Optional[str] = Field(None,example="Rent")
+    freq: Literal["daily", "weekly", "monthly", "yearly"] = Field(...,example="monthly")
+    interval: int = Field(1,ge=1,example=1)
+    start_date: datetime.date = Field(...,ge=MIN_RECURRING_DATE,example="2025-05-01")
+    end_date: Optional[datetime.date] = Field(None,ge=MIN_RECURRING_DATE,example="2026-04-30")
+
+class RecurringExpenseCreate(RecurringExpenseBase):
+    pass
+
+class RecurringExpenseRead(RecurringExpenseBase):
+    id: int
+
+    class Config:
+        from_attributes = True
+
+class RecurringExpenseUpdate(BaseModel):
+    category_id: Optional[int] = Field(None, example=1)
+    amount: Optional[float] = Field(None, ge=0, example=12500)
+    description: Optional[str] = Field(None, example="Rent")
+    freq: Optional[Literal["daily", "weekly", "monthly", "yearly"]] = Field(None, example="monthly")
+    interval: Optional[int] = Field(None, ge=1, example=1)
+    start_date: Optional[datetime.date] = Field(None, ge=MIN_RECURRING_DATE, example="2025-05-01")
+    end_date: Optional[datetime.date] = Field(None, ge=MIN_RECURRING_DATE, example="2026-04-30")
+
+class RecurringOverrideBase(BaseModel):
+    #skipped drops the occurrence, otherwise amount/description replace the rule's values when set
+    skipped: bool = Field(False, example=False)
+    amount: Optional[float] = Field(None, ge=0, example=13000)
+    description: Optional[str] = Field(None, example="Rent incl. maintenance")
+
+class RecurringOverrideCreate(RecurringOverrideBase):
+    pass
+
+class RecurringOverrideRead(RecurringOverrideBase):
+    recurring_id: int
+    date: datetime.date
+
+    class Config:
+        from_attributes = True
+
+
 #income schemas
 class IncomeBase(BaseModel):
     month: str = Field(...,example="2025-05")
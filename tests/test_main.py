@@ -202,4 +202,157 @@ def test_reset_endpoint_clears_data():
 
     assert client.get("/v1/categories/").json() == []
     assert client.get("/v1/expenses/").json() == []
-    assert client.get("/v1/income/2025-05").status_code == 404
\ No newline at end of file
+    assert client.get("/v1/income/2025-05").status_code == 404
+
+def test_recurring_expense_expansion_and_overrides():
+    r = client.post("/v1/categories/", json={"name":"Rent","limit_amount":1000})
+    cid = r.json()["id"]
+
+    #404 for bad category, 400 for end before start
+    rule = {"category_id":cid,"amount":900,"description":"Rent","freq":"monthly","start_date":"2025-01-31","end_date":"2025-12-31"}
+    r = client.post("/v1/recurring/", json={**rule, "category_id":9999})
+    assert r.status_code == 404
+    r = client.post("/v1/recurring/", json={**rule, "end_date":"2024-12-31"})
+    assert r.status_code == 400
+
+    r = client.post("/v1/recurring/", json=rule)
+    assert r.status_code == 201
+    rid = r.json()["id"]
+
+    #expanded lazily, the 31st clamps to the end of february
+    r = client.get("/v1/expenses/", params={"month":"2025-02"})
+    occ = [e for e in r.json() if e["recurring_id"] == rid]
+    assert len(occ) == 1 and occ[0]["date"] == "2025-02-28" and occ[0]["id"] is None
+
+    #nothing after end_date
+    r = client.get("/v1/expenses/", params={"month":"2026-01"})
+    assert not any(e["recurring_id"] == rid for e in r.json())
+
+    #override march, skip april
+    r = client.put(f"/v1/recurring/{rid}/occurrences/2025-03-31", json={"amount":950})
+    assert r.status_code == 200 and r.json()["amount"] == 950
+    r = client.put(f"/v1/recurring/{rid}/occurrences/2025-04-30", json={"skipped":True})
+    assert r.status_code == 200
+    r = client.put(f"/v1/recurring/{rid}/occurrences/2025-04-15", json={"skipped":True})
+    assert r.status_code == 404
+
+    r = client.get("/v1/expenses/", params={"month":"2025-03"})
+    assert [e["amount"] for e in r.json() if e["recurring_id"] == rid] == [950]
+    r = client.get("/v1/expenses/", params={"month":"2025-04"})
+    assert not any(e["recurring_id"] == rid for e in r.json())
+
+    #summary merges stored expenses and occurrences
+    client.post("/v1/expenses/", json={"category_id":cid,"amount":200,"date":"2025-03-05"})
+    client.post("/v1/income/", json={"month":"2025-03","amount":3000})
+    data = client.get("/v1/summary/2025-03").json()
+    rent = next(c for c in data["categories"] if c["category"] == "Rent")
+    assert rent["spent"] == 1150 and rent["over_limit"] is True
+
+    #restore april, then delete the rule
+    r = client.delete(f"/v1/recurring/{rid}/occurrences/2025-04-30")
+    assert r.status_code == 204
+    r = client.get("/v1/expenses/", params={"month":"2025-04"})
+    assert any(e["recurring_id"] == rid for e in r.json())
+
+    r = client.delete(f"/v1/recurring/{rid}")
+    assert r.status_code == 204
+    r = client.get(f"/v1/recurring/{rid}")
+    assert r.status_code == 404
+
+
+def test_categories_with_stats():
+    r = client.post("/v1/categories/", json={"name":"StatsCat","limit_amount":500})
+    cid = r.json()["id"]
+    r = client.post("/v1/categories/", json={"name":"EmptyCat","limit_amount":50})
+    empty_id = r.json()["id"]
+    client.post("/v1/expenses/", json={"category_id":cid,"amount":100,"date":"2025-08-03"})
+    client.post("/v1/expenses/", json={"category_id":cid,"amount":40,"date":"2025-08-20"})
+    client.post("/v1/expenses/", json={"category_id":cid,"amount":70,"date":"2025-09-01"})
+    client.post("/v1/recurring/", json={"category_id":cid,"amount":10,"freq":"weekly","start_date":"2025-08-01","end_date":"2025-08-31"})
+
+    #plain listing has no stats
+    r = client.get("/v1/categories/")
+    assert r.status_code == 200 and all("spent" not in c for c in r.json())
+
+    #month stats include stored expenses and recurring occurrences
+    r = client.get("/v1/categories/", params={"stats":True,"month":"2025-08"})
+    assert r.status_code == 200
+    cats = {c["id"]: c for c in r.json()}
+    assert cats[cid]["spent"] == 190 and cats[cid]["count"] == 7 and cats[cid]["remaining"] == 310
+    assert cats[empty_id]["spent"] == 0 and cats[empty_id]["count"] == 0 and cats[empty_id]["remaining"] == 50
+
+    #inclusive range
+    r = client.get("/v1/categories/", params={"stats":True,"start":"2025-08-20","end":"2025-09-01"})
+    cats = {c["id"]: c for c in r.json()}
+    assert cats[cid]["spent"] == 130 and cats[cid]["count"] == 4
+
+    #bad input
+    assert client.get("/v1/categories/", params={"stats":True,"month":"2025/08"}).status_code == 400
+    assert client.get("/v1/categories/", params={"stats":True,"start":"2025-08-01"}).status_code == 400
+
+
+def test_invalid_month_is_400():
+    client.post("/v1/income/", json={"month":"2025-13","amount":100})
+    assert client.get("/v1/summary/2025-13").status_code == 400
+    assert client.get("/v1/expenses/", params={"month":"2025-13"}).status_code == 400
+    assert client.get("/v1/categories/", params={"stats":True,"month":"2025-13"}).status_code == 400
+
+
+def test_recurring_listing_without_month_is_bounded():
+    r = client.post("/v1/categories/", json={"name":"Daily","limit_amount":10})
+    cid = r.json()["id"]
+    rule = {"category_id":cid,"amount":1,"freq":"daily","start_date":"1899-12-31"}
+    r = client.post("/v1/recurring/", json=rule)
+    assert r.status_code == 422
+
+    r = client.post("/v1/recurring/", json={**rule, "start_date":"1900-01-01"})
+    rid = r.json()["id"]
+    r = client.get("/v1/expenses/")
+    assert r.status_code == 200
+    assert len([e for e in r.json() if e["recurring_id"] == rid]) <= 366
+    client.delete(f"/v1/recurring/{rid}")
+
+
+def test_recurring_update_rejects_nulls_and_drops_stale_overrides():
+    r = client.post("/v1/categories/", json={"name":"Gym","limit_amount":100})
+    cid = r.json()["id"]
+    r = client.post("/v1/recurring/", json={"category_id":cid,"amount":30,"freq":"weekly","start_date":"2025-01-06"})
+    rid = r.json()["id"]
+
+    for field in ("start_date", "freq", "interval", "amount", "category_id"):
+        r = client.put(f"/v1/recurring/{rid}", json={field: None})
+        assert r.status_code == 400
+    #end_date is nullable
+    r = client.put(f"/v1/recurring/{rid}", json={"end_date": None})
+    assert r.status_code == 200
+
+    client.put(f"/v1/recurring/{rid}/occurrences/2025-01-13", json={"skipped":True})
+    client.put(f"/v1/recurring/{rid}/occurrences/2025-01-20", json={"amount":40})
+
+    #every other week from the 6th: the 20th still fires, the 13th no longer does
+    r = client.put(f"/v1/recurring/{rid}", json={"interval":2})
+    assert r.status_code == 200
+    assert client.delete(f"/v1/recurring/{rid}/occurrences/2025-01-13").status_code == 404
+    r = client.get("/v1/expenses/", params={"month":"2025-01"})
+    assert [(e["date"], e["amount"]) for e in r.json() if e["recurring_id"] == rid] == [("2025-01-06", 30), ("2025-01-20", 40)]
+
+
+def test_categories_stats_range_is_capped_and_counted_without_expanding():
+    r = client.post("/v1/categories/", json={"name":"Coffee","limit_amount":100})
+    cid = r.json()["id"]
+    r = client.post("/v1/recurring/", json={"category_id":cid,"amount":2,"freq":"daily","start_date":"1900-01-01"})
+    rid = r.json()["id"]
+    client.put(f"/v1/recurring/{rid}/occurrences/2025-02-10", json={"skipped":True})
+    client.put(f"/v1/recurring/{rid}/occurrences/2025-02-11", json={"amount":5})
+
+    #over the cap, and the day that used to overflow
+    r = client.get("/v1/categories/", params={"stats":True,"start":"1900-01-01","end":"9999-12-30"})
+    assert r.status_code == 400
+    r = client.get("/v1/categories/", params={"stats":True,"start":"9999-12-31","end":"9999-12-31"})
+    assert r.status_code == 400
+
+    #28 days, one skipped and one overridden
+    r = client.get("/v1/categories/", params={"stats":True,"month":"2025-02"})
+    coffee = next(c for c in r.json() if c["id"] == cid)
+    assert coffee["count"] == 27 and coffee["spent"] == 26 * 2 + 5
+    client.delete(f"/v1/recurring/{rid}")
@@ -0,0 +1,69 @@
+import sys,os
+from datetime import date, timedelta
+from types import SimpleNamespace
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+import recurrence
+
+
+def make_rule(freq, start_date, interval=1, end_date=None):
+    return SimpleNamespace(freq=freq, interval=interval, start_date=start_date, end_date=end_date)
+
+def walk(rule, start, end):
+    #brute force reference: step through every occurrence from start_date
+    days, n = [], 0
+    while recurrence.nth_occurrence(rule, n) < end:
+        day = recurrence.nth_occurrence(rule, n)
+        if day >= start and (rule.end_date is None or day <= rule.end_date):
+            days.append(day)
+        n += 1
+    return days
+
+
+def test_weekly_interval_starting_mid_range():
+    rule = make_rule("weekly", date(2025, 1, 1), interval=2)
+    assert recurrence.first_index(rule, date(2025, 3, 1)) == 5
+    assert list(recurrence.occurrences(rule, date(2025, 3, 1), date(2025, 4, 1))) == [date(2025, 3, 12), date(2025, 3, 26)]
+
+def test_daily_interval_starting_mid_range():
+    rule = make_rule("daily", date(2025, 1, 1), interval=3)
+    #jan 31 is index 10, so the 1st of feb starts at index 11 (feb 3)
+    assert recurrence.first_index(rule, date(2025, 1, 31)) == 10
+    assert recurrence.first_index(rule, date(2025, 2, 1)) == 11
+    assert list(recurrence.occurrences(rule, date(2025, 2, 1), date(2025, 2, 10))) == [date(2025, 2, 3), date(2025, 2, 6), date(2025, 2, 9)]
+
+def test_yearly_from_feb_29():
+    rule = make_rule("yearly", date(2024, 2, 29))
+    assert list(recurrence.occurrences(rule, date(2025, 1, 1), date(2029, 1, 1))) == [
+        date(2025, 2, 28), date(2026, 2, 28), date(2027, 2, 28), date(2028, 2, 29)
+    ]
+    assert recurrence.is_occurrence(rule, date(2028, 2, 29))
+    assert not recurrence.is_occurrence(rule, date(2025, 3, 1))
+
+def test_range_after_start_date_matches_walking_the_schedule():
+    rules = [
+        make_rule("daily", date(2024, 12, 30), interval=4),
+        make_rule("weekly", date(2024, 11, 7), interval=3),
+        make_rule("monthly", date(2024, 1, 31), interval=5, end_date=date(2026, 6, 30)),
+        make_rule("yearly", date(2020, 2, 29), interval=2),
+    ]
+    for rule in rules:
+        for start in (date(2025, 2, 28), date(2025, 3, 1), date(2025, 7, 15)):
+            end = start + timedelta(days=800)
+            assert list(recurrence.occurrences(rule, start, end)) == walk(rule, start, end)
+
+def test_end_date_and_year_9999_do_not_overflow():
+    rule = make_rule("yearly", date(9998, 6, 1), end_date=date.max)
+    assert list(recurrence.occurrences(rule, date(9998, 1, 1), date.max)) == [date(9998, 6, 1), date(9999, 6, 1)]
+
+def test_count_occurrences_matches_walking_the_schedule():
+    rules = [
+        make_rule("daily", date(2024, 12, 30), interval=4),
+        make_rule("weekly", date(2024, 11, 7), interval=3, end_date=date(2025, 9, 1)),
+        make_rule("monthly", date(2024, 1, 31), interval=5),
+        make_rule("yearly", date(2020, 2, 29), interval=2),
+    ]
+    for rule in rules:
+        for start in (date(2020, 1, 1), date(2025, 3, 1), date(2026, 1, 1)):
+            end = start + timedelta(days=800)
+            assert recurrence.count_occurrences(rule, start, end) == len(walk(rule, start, end))